@@ -28,7 +28,7 @@ from app.schemas.annotation import (
     AnnotationResponse,
     AnnotationUpdate,
 )
-from app.storage.local import read_confidence_report, read_file, get_path, read_uncertainty_map, save_export
+from app.storage.local import read_confidence_report, read_file, get_path, read_uncertainty_map, save_export, save_export_with_digest
 from app.services.audit import log_event
 from app.services.async_jobs import enqueue_job, job_worker
 from app.services.mesh import convert_mesh
@@ -342,8 +342,7 @@ def export_model(
         .count()
         + 1
     )
-    key = save_export(converted, f"{model_id}_v{export_version}", extension)
-    checksum = hashlib.sha256(converted).hexdigest()
+    key, checksum = save_export_with_digest(converted, f"{model_id}_v{export_version}", extension)
     signature = hmac.new(
         get_settings().secret_key.encode("utf-8"), checksum.encode("utf-8"), digestmod=hashlib.sha256
     ).hexdigest()
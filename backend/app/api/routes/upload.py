@@ -9,8 +9,8 @@ from sqlalchemy.orm import Session
 from app.api.deps import get_db
 from app.db import models
 from app.schemas.upload import UploadResponse, UploadValidation
-from app.services.dicom import ingest_dicom, is_dicom_upload
-from app.storage.local import save_upload, get_path
+from app.services.dicom import ingest_dicom_async, is_dicom_upload
+from app.storage.local import save_upload_async, get_path
 from app.services.audit import log_event
 
 router = APIRouter(prefix="/upload", tags=["upload"])
@@ -105,10 +105,10 @@ async def upload_xrays(
         resolved_view = view
 
         if is_dicom_upload(file.filename, file.content_type, content):
-            dicom = ingest_dicom(content)
+            dicom = await ingest_dicom_async(content)
             payload_bytes = dicom.render_bytes
-            payload_name = (file.filename or "xray.dcm").rsplit(".", 1)[0] + ".png"
-            dicom_key = save_upload(dicom.deidentified_bytes, (file.filename or "xray.dcm"))
+            payload_name = (file.filename or "xray.dcm").rsplit(".", 1)[0] + "." + dicom.render_extension
+            dicom_key = await save_upload_async(dicom.deidentified_bytes, (file.filename or "xray.dcm"))
 
             if study is None:
                 study = models.Study(
@@ -159,7 +159,7 @@ async def upload_xrays(
             db.commit()
             db.refresh(series)
 
-        key = save_upload(payload_bytes, payload_name)
+        key = await save_upload_async(payload_bytes, payload_name)
         xray = models.XRayImage(
             case_id=case.id,
             series_id=series.id if series else None,
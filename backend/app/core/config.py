@@ -24,6 +24,10 @@ class Settings(BaseSettings):
     reconstruction_model: str = "heightmap"
     reconstruction_batch_size: int = 4
     reconstruction_seed: int = 42
+    reconstruction_cudnn_benchmark: bool = False
+    dicom_preview_format: str = "png"
+    dicom_preview_png_compression: int = 1
+    dicom_preview_jpeg_quality: int = 85
 
     @property
     def cors_origin_list(self) -> list[str]:
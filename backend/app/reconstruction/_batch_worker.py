@@ -0,0 +1,38 @@
+"""Process-pool worker entry points for ``ReconstructionPipeline.run_batch``.
+
+Kept free of torch/model imports at module scope so ``init_worker`` can pin
+``CUDA_VISIBLE_DEVICES`` before the worker touches CUDA.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.reconstruction.engine import ReconstructionResult, XRayInput
+    from app.reconstruction.pipeline import ReconstructionPipeline
+
+_pipeline: ReconstructionPipeline | None = None
+
+
+def init_worker(model_name: str, seed: int, slots: Any, gpu_count: int) -> None:
+    global _pipeline
+    with slots.get_lock():
+        slot = slots.value
+        slots.value += 1
+    if gpu_count > 0:
+        os.environ["CUDA_VISIBLE_DEVICES"] = str(slot % gpu_count)
+
+    from app.reconstruction.pipeline import ReconstructionPipeline
+
+    # Pipeline construction seeds this worker process once.
+    _pipeline = ReconstructionPipeline(model_name=model_name, seed=seed, max_workers=1)
+
+
+def reconstruct_one(case_inputs: list[XRayInput]) -> ReconstructionResult:
+    if _pipeline is None:
+        raise RuntimeError("Batch worker was not initialized")
+    result = _pipeline.model.reconstruct(case_inputs)
+    result.pipeline_version = _pipeline.model.pipeline_version
+    return result
@@ -0,0 +1,116 @@
+"""Minimal single-primitive GLB (glTF 2.0 binary) writer.
+
+Emits one triangle mesh with POSITION, optional NORMAL / COLOR_0 and uint32
+indices, without going through trimesh's scene exporter.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from typing import BinaryIO
+
+import numpy as np
+
+_FLOAT = 5126
+_UNSIGNED_BYTE = 5121
+_UNSIGNED_INT = 5125
+_ARRAY_BUFFER = 34962
+_ELEMENT_ARRAY_BUFFER = 34963
+
+
+def write_glb(
+    file_obj: BinaryIO,
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    vertex_normals: np.ndarray | None = None,
+    vertex_colors: np.ndarray | None = None,
+    generator: str = "OrthoGenesisAI",
+) -> None:
+    vertices = np.ascontiguousarray(vertices, dtype=np.float32)
+    indices = np.ascontiguousarray(faces, dtype=np.uint32).reshape(-1)
+
+    attributes: dict[str, int] = {}
+    accessors: list[dict] = []
+    buffer_views: list[dict] = []
+    blobs: list[np.ndarray] = []
+
+    def add_view(blob: np.ndarray, target: int) -> int:
+        offset = sum(item.nbytes for item in blobs)
+        buffer_views.append({"buffer": 0, "byteOffset": offset, "byteLength": blob.nbytes, "target": target})
+        blobs.append(blob)
+        return len(buffer_views) - 1
+
+    accessors.append(
+        {
+            "bufferView": add_view(indices, _ELEMENT_ARRAY_BUFFER),
+            "componentType": _UNSIGNED_INT,
+            "count": int(indices.size),
+            "type": "SCALAR",
+            "min": [int(indices.min())] if indices.size else [0],
+            "max": [int(indices.max())] if indices.size else [0],
+        }
+    )
+    attributes["POSITION"] = len(accessors)
+    accessors.append(
+        {
+            "bufferView": add_view(vertices, _ARRAY_BUFFER),
+            "componentType": _FLOAT,
+            "count": len(vertices),
+            "type": "VEC3",
+            "min": vertices.min(axis=0).tolist(),
+            "max": vertices.max(axis=0).tolist(),
+        }
+    )
+    if vertex_normals is not None:
+        normals = np.ascontiguousarray(vertex_normals, dtype=np.float32)
+        attributes["NORMAL"] = len(accessors)
+        accessors.append(
+            {
+                "bufferView": add_view(normals, _ARRAY_BUFFER),
+                "componentType": _FLOAT,
+                "count": len(normals),
+                "type": "VEC3",
+            }
+        )
+    if vertex_colors is not None:
+        # Every view length must stay a multiple of 4, so colours are always RGBA.
+        colors = np.asarray(vertex_colors, dtype=np.uint8)
+        if colors.shape[1] == 3:
+            colors = np.concatenate([colors, np.full((len(colors), 1), 255, dtype=np.uint8)], axis=1)
+        colors = np.ascontiguousarray(colors)
+        attributes["COLOR_0"] = len(accessors)
+        accessors.append(
+            {
+                "bufferView": add_view(colors, _ARRAY_BUFFER),
+                "componentType": _UNSIGNED_BYTE,
+                "normalized": True,
+                "count": len(colors),
+                "type": "VEC4",
+            }
+        )
+
+    bin_len = sum(item.nbytes for item in blobs)
+    gltf = {
+        "asset": {"version": "2.0", "generator": generator},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"mesh": 0}],
+        "meshes": [{"primitives": [{"attributes": attributes, "indices": 0, "mode": 4}]}],
+        "accessors": accessors,
+        "bufferViews": buffer_views,
+        "buffers": [{"byteLength": bin_len}],
+    }
+    gltf_json = json.dumps(gltf, separators=(",", ":")).encode("utf-8")
+    json_pad = -len(gltf_json) % 4
+    bin_pad = -bin_len % 4
+
+    total = 12 + 8 + len(gltf_json) + json_pad + 8 + bin_len + bin_pad
+    file_obj.write(struct.pack("<4sII", b"glTF", 2, total))
+    file_obj.write(struct.pack("<I4s", len(gltf_json) + json_pad, b"JSON"))
+    file_obj.write(gltf_json)
+    file_obj.write(b" " * json_pad)
+    file_obj.write(struct.pack("<I4s", bin_len + bin_pad, b"BIN\x00"))
+    for blob in blobs:
+        file_obj.write(blob.data)
+    file_obj.write(b"\x00" * bin_pad)
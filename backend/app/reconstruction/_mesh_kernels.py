@@ -0,0 +1,106 @@
+"""Numba kernels for heightmap mesh construction.
+
+Both kernels are ``None`` when numba is not installed; callers fall back to the
+vectorized NumPy path in ``ReconstructionEngine``.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except Exception:  # pragma: no cover - optional runtime dependency
+    njit = None
+
+
+def _count_heightmap_faces(cell_active: np.ndarray) -> int:
+    rows, cols = cell_active.shape
+    count = 0
+    for y in range(rows):
+        for x in range(cols):
+            if not cell_active[y, x]:
+                continue
+            count += 4
+            if y == 0 or not cell_active[y - 1, x]:
+                count += 2
+            if y == rows - 1 or not cell_active[y + 1, x]:
+                count += 2
+            if x == 0 or not cell_active[y, x - 1]:
+                count += 2
+            if x == cols - 1 or not cell_active[y, x + 1]:
+                count += 2
+    return count
+
+
+def _put_face(faces_out: np.ndarray, k: int, a: int, b: int, c: int) -> int:
+    faces_out[k, 0] = a
+    faces_out[k, 1] = b
+    faces_out[k, 2] = c
+    return k + 1
+
+
+def _build_heightmap_mesh(
+    heightmap: np.ndarray,
+    cell_active: np.ndarray,
+    height_scale: float,
+    base_thickness: float,
+    vertices_out: np.ndarray,
+    faces_out: np.ndarray,
+) -> int:
+    """Fill ``vertices_out`` (2*rows*cols, 3) and ``faces_out`` in one pass; returns faces written."""
+    rows, cols = heightmap.shape
+    vertex_count = rows * cols
+
+    for y in range(rows):
+        for x in range(cols):
+            i = y * cols + x
+            px = (x / cols - 0.5) * cols
+            pz = (y / rows - 0.5) * rows
+            vertices_out[i, 0] = px
+            vertices_out[i, 1] = heightmap[y, x] * height_scale
+            vertices_out[i, 2] = pz
+            vertices_out[vertex_count + i, 0] = px
+            vertices_out[vertex_count + i, 1] = -base_thickness
+            vertices_out[vertex_count + i, 2] = pz
+
+    k = 0
+    for y in range(rows - 1):
+        for x in range(cols - 1):
+            if not cell_active[y, x]:
+                continue
+            tl = y * cols + x
+            tr = tl + 1
+            bl = tl + cols
+            br = bl + 1
+            btl = tl + vertex_count
+            btr = tr + vertex_count
+            bbl = bl + vertex_count
+            bbr = br + vertex_count
+
+            k = _put_face(faces_out, k, tl, bl, tr)
+            k = _put_face(faces_out, k, tr, bl, br)
+            k = _put_face(faces_out, k, btl, btr, bbl)
+            k = _put_face(faces_out, k, btr, bbr, bbl)
+            if y == 0 or not cell_active[y - 1, x]:
+                k = _put_face(faces_out, k, tl, btl, tr)
+                k = _put_face(faces_out, k, tr, btl, btr)
+            if y == rows - 2 or not cell_active[y + 1, x]:
+                k = _put_face(faces_out, k, bl, br, bbl)
+                k = _put_face(faces_out, k, br, bbr, bbl)
+            if x == 0 or not cell_active[y, x - 1]:
+                k = _put_face(faces_out, k, tl, bl, btl)
+                k = _put_face(faces_out, k, bl, bbl, btl)
+            if x == cols - 2 or not cell_active[y, x + 1]:
+                k = _put_face(faces_out, k, tr, btr, br)
+                k = _put_face(faces_out, k, br, btr, bbr)
+    return k
+
+
+if njit is not None:
+    _put_face = njit(cache=True, inline="always")(_put_face)
+    count_heightmap_faces = njit(cache=True, boundscheck=False)(_count_heightmap_faces)
+    build_heightmap_mesh = njit(cache=True, boundscheck=False)(_build_heightmap_mesh)
+else:
+    count_heightmap_faces = None
+    build_heightmap_mesh = None
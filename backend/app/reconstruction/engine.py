@@ -1,20 +1,72 @@
 from __future__ import annotations
 
-from collections import deque
+import functools
+import hashlib
+import math
+import threading
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from io import BytesIO
 from typing import Any, Iterable
 
 import numpy as np
 import torch
+import torch.nn.functional as F
 import trimesh
-from PIL import Image, ImageFilter, ImageOps
+from PIL import Image, ImageFilter
 try:
     from scipy import ndimage as ndi
 except Exception:  # pragma: no cover - optional runtime dependency
     ndi = None
+try:
+    import cv2
+except Exception:  # pragma: no cover - optional runtime dependency
+    cv2 = None
+try:
+    import numexpr as ne
+except Exception:  # pragma: no cover - optional runtime dependency
+    ne = None
+
+from app.reconstruction._glb_writer import write_glb
+from app.reconstruction._mesh_kernels import build_heightmap_mesh, count_heightmap_faces
+from app.storage.local import get_path, open_model_writer, save_confidence_report
+
+# One-shot probe validating torch/CUDA plumbing at import rather than on every request.
+_CUDA_HEALTH = torch.zeros(1, device="cuda" if torch.cuda.is_available() else "cpu")
+
+
+@functools.lru_cache(maxsize=8)
+def _neighbourhood_sizes(rows: int, cols: int) -> np.ndarray:
+    """Number of in-bounds cells in each vertex's 3x3 window; depends only on the grid shape."""
+    def axis_counts(n: int) -> np.ndarray:
+        idx = np.arange(n)
+        return (np.minimum(idx + 1, n - 1) - np.maximum(idx - 1, 0) + 1).astype(np.float64)
 
-from app.storage.local import save_confidence_report, save_model
+    sizes = np.outer(axis_counts(rows), axis_counts(cols))
+    sizes.setflags(write=False)
+    return sizes
+
+
+def _decode_greyscale(data: bytes) -> np.ndarray:
+    pixels = None
+    if cv2 is not None:
+        pixels = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+    if pixels is None:
+        pixels = np.array(Image.open(BytesIO(data)).convert("L"))
+    return pixels
+
+
+def decode_xray_pinned(data: bytes) -> np.ndarray:
+    """Decode to greyscale uint8, landing in page-locked memory when CUDA is available.
+
+    Pinned host buffers let the device upload in ``_denoise_on_gpu`` run asynchronously.
+    """
+    pixels = _decode_greyscale(data)
+    if not torch.cuda.is_available():
+        return pixels
+    pinned = torch.empty(pixels.shape, dtype=torch.uint8, pin_memory=True).numpy()
+    pinned[...] = pixels
+    return pinned
 
 
 @dataclass
@@ -22,6 +74,8 @@ class XRayInput:
     view: str
     content_type: str
     data: bytes
+    # Greyscale pixels decoded at ingest (see ``decode_xray_pinned``); decoded from ``data`` when absent.
+    pixels: np.ndarray | None = None
 
 
 @dataclass
@@ -41,12 +95,15 @@ class ReconstructionEngine:
     For single-image testing, generates a heightmap mesh from the X-ray.
     """
 
-    def reconstruct(self, inputs: Iterable[XRayInput]) -> ReconstructionResult:
-        input_list = list(inputs)
+    # The heightmap pipeline is deterministic, so identical inputs map to the same mesh.
+    _MESH_CACHE_SIZE = 64
 
-        # Placeholder tensor to validate CUDA plumbing and torch availability.
-        _dummy = torch.zeros((64, 64, 64))
+    def __init__(self) -> None:
+        self._mesh_cache: OrderedDict[str, tuple[str, dict[str, Any]]] = OrderedDict()
+        self._mesh_cache_lock = threading.Lock()
 
+    def reconstruct(self, inputs: Iterable[XRayInput]) -> ReconstructionResult:
+        input_list = list(inputs)
         mesh_key, confidence_report = self._mesh_from_inputs(input_list)
         is_multiview = len(input_list) >= 3
         return ReconstructionResult(
@@ -63,10 +120,31 @@ class ReconstructionEngine:
         )
 
     def _mesh_from_inputs(self, inputs: list[XRayInput]) -> tuple[str, dict[str, Any]]:
-        maps: list[np.ndarray] = []
-        for idx, item in enumerate(inputs):
-            sigma = 1.0 + min(0.35, idx * 0.04)
-            maps.append(self._extract_bone_heightmap(item.data, target_size=512, blur_sigma=sigma))
+        cache_key = self._inputs_digest(inputs)
+        with self._mesh_cache_lock:
+            cached = self._mesh_cache.get(cache_key)
+            if cached is not None:
+                self._mesh_cache.move_to_end(cache_key)
+        if cached is not None and get_path(cached[0]).exists():
+            return cached[0], dict(cached[1])
+
+        mesh_key, confidence_report = self._build_mesh(inputs)
+        with self._mesh_cache_lock:
+            self._mesh_cache[cache_key] = (mesh_key, dict(confidence_report))
+            self._mesh_cache.move_to_end(cache_key)
+            while len(self._mesh_cache) > self._MESH_CACHE_SIZE:
+                self._mesh_cache.popitem(last=False)
+        return mesh_key, confidence_report
+
+    def _inputs_digest(self, inputs: list[XRayInput]) -> str:
+        hasher = hashlib.blake2b(digest_size=16)
+        for item in inputs:
+            hasher.update(len(item.data).to_bytes(8, "little"))
+            hasher.update(item.data)
+        return hasher.hexdigest()
+
+    def _build_mesh(self, inputs: list[XRayInput]) -> tuple[str, dict[str, Any]]:
+        maps = self._extract_bone_heightmaps(inputs, target_size=512)
 
         if not maps:
             raise ValueError("No input images were provided")
@@ -95,50 +173,143 @@ class ReconstructionEngine:
         mesh, confidence_report = self._heightmap_to_mesh(heightmap, height_scale=46.0, surface_floor=0.008)
         confidence_report["mode"] = mode
         confidence_report["input_views"] = len(inputs)
-        glb = mesh.export(file_type="glb")
-        if isinstance(glb, str):
-            glb_bytes = glb.encode("utf-8")
-        else:
-            glb_bytes = glb
-        mesh_key = save_model(glb_bytes, ext="glb")
+        with open_model_writer(ext="glb") as (mesh_key, handle):
+            colors = mesh.visual.vertex_colors if mesh.visual.kind == "vertex" else None
+            write_glb(handle, mesh.vertices, mesh.faces, vertex_colors=colors)
         save_confidence_report(mesh_key, confidence_report)
         return mesh_key, confidence_report
 
-    def _extract_bone_heightmap(self, data: bytes, target_size: int, blur_sigma: float) -> np.ndarray:
-        image = Image.open(BytesIO(data)).convert("L")
-        image.thumbnail((target_size, target_size), Image.Resampling.LANCZOS)
-        image = image.filter(ImageFilter.MedianFilter(size=3))
-        image = image.filter(ImageFilter.GaussianBlur(radius=blur_sigma))
-        image = ImageOps.autocontrast(image, cutoff=0)
-
-        pixels = np.asarray(image, dtype=np.uint8)
-        pixels_f32 = pixels.astype(np.float32)
-
-        mean = float(np.mean(pixels_f32))
-        stddev = float(np.std(pixels_f32))
-        p_low = float(np.percentile(pixels_f32, 2.0))
-        p_high = float(np.percentile(pixels_f32, 98.0))
-        threshold = min(255.0, max(mean + stddev * 0.28, float(np.percentile(pixels_f32, 70.0))))
+    def _extract_bone_heightmaps(self, inputs: list[XRayInput], target_size: int) -> list[np.ndarray]:
+        """Per-view bone heightmaps; the statistics and blend run once per stack of same-shape views."""
+        pixels: list[np.ndarray] = []
+        for idx, item in enumerate(inputs):
+            sigma = 1.0 + min(0.35, idx * 0.04)
+            denoised = self._load_denoised_pixels(item.data, target_size, sigma, item.pixels)
+            pixels.append(self._autocontrast(denoised))
+
+        groups: dict[tuple[int, ...], list[int]] = {}
+        for idx, item in enumerate(pixels):
+            groups.setdefault(item.shape, []).append(idx)
+
+        maps: list[np.ndarray] = [np.empty(0)] * len(pixels)
+        for shape, members in groups.items():
+            if 0 in shape:
+                for idx in members:
+                    maps[idx] = np.zeros((2, 2), dtype=np.float32)
+                continue
+            bones = self._bone_response(np.stack([pixels[idx] for idx in members]).astype(np.float32))
+            for idx, bone in zip(members, bones):
+                maps[idx] = self._smooth_bone(bone)
+        return maps
+
+    @staticmethod
+    def _bone_response(stack: np.ndarray) -> np.ndarray:
+        """Adaptive bone response for a ``(B, H, W)`` float32 stack of autocontrasted views."""
+        flat = stack.reshape(len(stack), -1)
+        # Statistics reduce in float32 like the single-view path but combine in float64.
+        mean = np.mean(flat, axis=1).astype(np.float64)
+        stddev = np.std(flat, axis=1).astype(np.float64)
+        p_low, p_70, p_high = np.percentile(flat, [2.0, 70.0, 98.0], axis=1).astype(np.float64)
+        threshold = np.minimum(255.0, np.maximum(mean + stddev * 0.28, p_70))
 
         # Blend adaptive threshold with full intensity map to preserve internal bone contours.
-        norm = np.clip((pixels_f32 - p_low) / max(1.0, p_high - p_low), 0.0, 1.0)
-        mask = np.clip((pixels_f32 - threshold) / max(1.0, 255.0 - threshold), 0.0, 1.0)
-        bone = (0.62 * mask + 0.38 * np.clip(norm - 0.2, 0.0, 1.0)).astype(np.float32)
+        def per_view(values: np.ndarray) -> np.ndarray:
+            return values.astype(np.float32)[:, None, None]
 
-        if bone.size == 0:
-            return np.zeros((2, 2), dtype=np.float32)
+        norm = np.clip((stack - per_view(p_low)) / per_view(np.maximum(1.0, p_high - p_low)), 0.0, 1.0)
+        mask = np.clip((stack - per_view(threshold)) / per_view(np.maximum(1.0, 255.0 - threshold)), 0.0, 1.0)
+        return (0.62 * mask + 0.38 * np.clip(norm - 0.2, 0.0, 1.0)).astype(np.float32)
 
+    @staticmethod
+    def _smooth_bone(bone: np.ndarray) -> np.ndarray:
         # Smooth staircase artifacts and normalize final range.
-        smooth = Image.fromarray(np.clip(bone * 255.0, 0, 255).astype(np.uint8))
-        smooth = smooth.filter(ImageFilter.MedianFilter(size=5))
-        smooth = smooth.filter(ImageFilter.GaussianBlur(radius=1.05))
-        bone = np.asarray(smooth, dtype=np.float32) / 255.0
-        if np.max(bone) > 0:
-            bone = bone / np.max(bone)
-        bone = np.power(bone, 0.86)
+        smooth = np.clip(bone * 255.0, 0, 255).astype(np.uint8)
+        if cv2 is not None:
+            smooth = cv2.GaussianBlur(cv2.medianBlur(smooth, 5), (0, 0), 1.05)
+        else:
+            image = Image.fromarray(smooth).filter(ImageFilter.MedianFilter(size=5))
+            smooth = np.asarray(image.filter(ImageFilter.GaussianBlur(radius=1.05)))
+        bone = smooth.astype(np.float32) / 255.0
+        peak = float(bone.max())
+        if peak <= 0.0:
+            return bone
+        if ne is not None:
+            # Single fused pass: (bone / peak) ** 0.86 < 0.006  <=>  bone < cutoff.
+            params = {
+                "bone": bone,
+                "peak": np.float32(peak),
+                "gamma": np.float32(0.86),
+                "cutoff": np.float32(peak * 0.006 ** (1.0 / 0.86)),
+                "zero": np.float32(0.0),
+            }
+            return ne.evaluate("where(bone < cutoff, zero, (bone / peak) ** gamma)", local_dict=params)
+        np.divide(bone, peak, out=bone)
+        np.power(bone, 0.86, out=bone)
         bone[bone < 0.006] = 0.0
         return bone
 
+    def _load_denoised_pixels(
+        self, data: bytes, target_size: int, blur_sigma: float, pixels: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Decode to greyscale uint8, shrink to fit ``target_size`` and apply median + Gaussian denoise."""
+        if pixels is None:
+            pixels = _decode_greyscale(data)
+
+        if torch.cuda.is_available():
+            return self._denoise_on_gpu(pixels, target_size, blur_sigma)
+
+        height, width = pixels.shape
+        size = self._thumbnail_size(height, width, target_size)
+        if cv2 is not None:
+            if size != (height, width):
+                pixels = cv2.resize(pixels, (size[1], size[0]), interpolation=cv2.INTER_AREA)
+            pixels = cv2.medianBlur(pixels, 3)
+            return cv2.GaussianBlur(pixels, (0, 0), blur_sigma)
+
+        image = Image.fromarray(pixels)
+        image.thumbnail((target_size, target_size), Image.Resampling.LANCZOS)
+        image = image.filter(ImageFilter.MedianFilter(size=3))
+        image = image.filter(ImageFilter.GaussianBlur(radius=blur_sigma))
+        return np.asarray(image, dtype=np.uint8)
+
+    @staticmethod
+    def _thumbnail_size(height: int, width: int, target_size: int) -> tuple[int, int]:
+        scale = min(1.0, target_size / float(max(height, width)))
+        return max(1, round(height * scale)), max(1, round(width * scale))
+
+    @staticmethod
+    def _autocontrast(pixels: np.ndarray) -> np.ndarray:
+        """Min/max stretch to the full uint8 range (``ImageOps.autocontrast(cutoff=0)``) as one LUT gather."""
+        lo = int(pixels.min()) if pixels.size else 0
+        hi = int(pixels.max()) if pixels.size else 0
+        if hi <= lo:
+            return pixels
+        scale = 255.0 / (hi - lo)
+        lut = np.clip(np.arange(256, dtype=np.float64) * scale - lo * scale, 0, 255).astype(np.uint8)
+        return lut[pixels]
+
+    def _denoise_on_gpu(self, pixels: np.ndarray, target_size: int, blur_sigma: float) -> np.ndarray:
+        """CUDA counterpart of the thumbnail -> 3x3 median -> Gaussian blur chain."""
+        height, width = pixels.shape
+        size = self._thumbnail_size(height, width, target_size)
+
+        img = torch.from_numpy(pixels).to("cuda", non_blocking=True).float().div_(255.0)[None, None]
+        if size != (height, width):
+            img = F.interpolate(img, size=size, mode="bilinear", align_corners=False, antialias=True)
+
+        padded = F.pad(img, (1, 1, 1, 1), mode="replicate")
+        img = padded.unfold(2, 3, 1).unfold(3, 3, 1).reshape(*img.shape, 9).median(dim=-1).values
+
+        # Separable Gaussian: one horizontal and one vertical 1-D pass.
+        radius = max(1, math.ceil(3.0 * blur_sigma))
+        offsets = torch.arange(-radius, radius + 1, device=img.device, dtype=img.dtype)
+        kernel = torch.exp(-0.5 * (offsets / blur_sigma) ** 2)
+        kernel = kernel / kernel.sum()
+        img = F.conv2d(F.pad(img, (radius, radius, 0, 0), mode="replicate"), kernel.view(1, 1, 1, -1))
+        img = F.conv2d(F.pad(img, (0, 0, radius, radius), mode="replicate"), kernel.view(1, 1, -1, 1))
+
+        return img[0, 0].mul_(255.0).round_().clamp_(0.0, 255.0).to(torch.uint8).cpu().numpy()
+
     def _clean_heightmap(self, heightmap: np.ndarray) -> np.ndarray:
         if heightmap.size == 0:
             return heightmap
@@ -318,78 +489,48 @@ class ReconstructionEngine:
 
         vertex_count = rows * cols
         total_vertices = vertex_count * 2
-        positions = np.zeros((total_vertices, 3), dtype=np.float32)
-        vertex_confidence = np.zeros((total_vertices,), dtype=np.float32)
+        # Every slot is written by the vertex fill below, so skip the zero-init.
+        positions = np.empty((total_vertices, 3), dtype=np.float32)
+        vertex_confidence = np.empty((total_vertices,), dtype=np.float32)
 
         base_thickness = max(4.5, height_scale * 0.14)
 
-        faces: list[list[int]] = []
-        cell_active = np.zeros((rows - 1, cols - 1), dtype=bool)
-        support = heightmap > surface_floor
-
-        def top_index(y: int, x: int) -> int:
-            return y * cols + x
-
-        def bottom_index(y: int, x: int) -> int:
-            return vertex_count + y * cols + x
-
-        for y in range(rows):
-            for x in range(cols):
-                i = top_index(y, x)
-                intensity = float(heightmap[y, x])
-                positions[i, 0] = (x / cols - 0.5) * cols
-                positions[i, 1] = intensity * height_scale
-                positions[i, 2] = (y / rows - 0.5) * rows
-                vertex_confidence[i] = self._top_vertex_confidence(heightmap, y, x, surface_floor)
-
-                bi = bottom_index(y, x)
-                positions[bi, 0] = positions[i, 0]
-                positions[bi, 1] = -base_thickness
-                positions[bi, 2] = positions[i, 2]
-                vertex_confidence[bi] = 0.08
-
-        for y in range(rows - 1):
-            for x in range(cols - 1):
-                if not (support[y, x] or support[y, x + 1] or support[y + 1, x] or support[y + 1, x + 1]):
-                    continue
-                cell_active[y, x] = True
-
-        for y in range(rows - 1):
-            for x in range(cols - 1):
-                if not cell_active[y, x]:
-                    continue
+        # A cell is meshed when any of its four corners rises above the surface floor.
+        corner_max = np.maximum(
+            np.maximum(heightmap[:-1, :-1], heightmap[:-1, 1:]),
+            np.maximum(heightmap[1:, :-1], heightmap[1:, 1:]),
+        )
+        cell_active = corner_max > surface_floor
 
-                tl = top_index(y, x)
-                tr = top_index(y, x + 1)
-                bl = top_index(y + 1, x)
-                br = top_index(y + 1, x + 1)
-                faces.append([tl, bl, tr])
-                faces.append([tr, bl, br])
-
-                btl = bottom_index(y, x)
-                btr = bottom_index(y, x + 1)
-                bbl = bottom_index(y + 1, x)
-                bbr = bottom_index(y + 1, x + 1)
-                faces.append([btl, btr, bbl])
-                faces.append([btr, bbr, bbl])
-                if y == 0 or not cell_active[y - 1, x]:
-                    faces.append([tl, btl, tr])
-                    faces.append([tr, btl, btr])
-                if y == rows - 2 or not cell_active[y + 1, x]:
-                    faces.append([bl, br, bbl])
-                    faces.append([br, bbr, bbl])
-                if x == 0 or not cell_active[y, x - 1]:
-                    faces.append([tl, bl, btl])
-                    faces.append([bl, bbl, btl])
-                if x == cols - 2 or not cell_active[y, x + 1]:
-                    faces.append([tr, btr, br])
-                    faces.append([br, btr, bbr])
-
-        if not faces:
+        if torch.cuda.is_available():
+            faces_array = self._heightmap_geometry_on_gpu(
+                heightmap, cell_active, height_scale, base_thickness, positions
+            )
+        elif build_heightmap_mesh is not None:
+            faces_array = np.empty((count_heightmap_faces(cell_active), 3), dtype=np.int32)
+            build_heightmap_mesh(heightmap, cell_active, height_scale, base_thickness, positions, faces_array)
+        else:
+            # Write X/Y/Z columns straight into the final (2N, 3) buffer; the base layer
+            # shares X/Z with the top surface and only differs in height.
+            top = positions[:vertex_count].reshape(rows, cols, 3)
+            top[:, :, 0] = (np.arange(cols) / cols - 0.5) * cols
+            top[:, :, 1] = heightmap * np.float64(height_scale)
+            top[:, :, 2] = ((np.arange(rows) / rows - 0.5) * rows)[:, None]
+            positions[vertex_count:, 0] = positions[:vertex_count, 0]
+            positions[vertex_count:, 1] = -base_thickness
+            positions[vertex_count:, 2] = positions[:vertex_count, 2]
+            faces_array = self._heightmap_faces(cell_active, cols, vertex_count)
+
+        vertex_confidence[:vertex_count] = self._top_vertex_confidence(heightmap, surface_floor).ravel()
+        vertex_confidence[vertex_count:] = 0.08
+
+        if faces_array.size == 0:
             # Fallback if thresholding removed everything.
-            faces = [[0, 1, cols], [1, cols + 1, cols], [vertex_count, vertex_count + 1, vertex_count + cols]]
+            faces_array = np.array(
+                [[0, 1, cols], [1, cols + 1, cols], [vertex_count, vertex_count + 1, vertex_count + cols]],
+                dtype=np.int32,
+            )
 
-        faces_array = np.array(faces, dtype=np.int64)
         used_vertices = np.unique(faces_array.reshape(-1))
         used_confidence = vertex_confidence[used_vertices]
 
@@ -425,6 +566,104 @@ class ReconstructionEngine:
         confidence_report = self._build_confidence_report(used_confidence, surface_floor)
         return mesh, confidence_report
 
+    def _heightmap_faces(self, cell_active: np.ndarray, cols: int, vertex_count: int) -> np.ndarray:
+        """Triangulate active cells: top/bottom caps plus side walls along the active-region border."""
+        cell_y, cell_x = np.nonzero(cell_active)
+        tl = (cell_y * cols + cell_x).astype(np.int32)
+        tr = tl + 1
+        bl = tl + cols
+        br = bl + 1
+        btl = tl + vertex_count
+        btr = tr + vertex_count
+        bbl = bl + vertex_count
+        bbr = br + vertex_count
+
+        # Padding makes out-of-grid neighbours read as inactive, so border cells get walls.
+        padded = np.pad(cell_active, 1, mode="constant", constant_values=False)
+        py = cell_y + 1
+        px = cell_x + 1
+        open_north = ~padded[py - 1, px]
+        open_south = ~padded[py + 1, px]
+        open_west = ~padded[py, px - 1]
+        open_east = ~padded[py, px + 1]
+
+        return np.concatenate(
+            [
+                np.stack([tl, bl, tr], axis=1),
+                np.stack([tr, bl, br], axis=1),
+                np.stack([btl, btr, bbl], axis=1),
+                np.stack([btr, bbr, bbl], axis=1),
+                np.stack([tl, btl, tr], axis=1)[open_north],
+                np.stack([tr, btl, btr], axis=1)[open_north],
+                np.stack([bl, br, bbl], axis=1)[open_south],
+                np.stack([br, bbr, bbl], axis=1)[open_south],
+                np.stack([tl, bl, btl], axis=1)[open_west],
+                np.stack([bl, bbl, btl], axis=1)[open_west],
+                np.stack([tr, btr, br], axis=1)[open_east],
+                np.stack([br, btr, bbr], axis=1)[open_east],
+            ]
+        )
+
+    def _heightmap_geometry_on_gpu(
+        self,
+        heightmap: np.ndarray,
+        cell_active: np.ndarray,
+        height_scale: float,
+        base_thickness: float,
+        positions_out: np.ndarray,
+    ) -> np.ndarray:
+        """Build vertices (copied into ``positions_out``) and faces for the heightmap grid on CUDA."""
+        rows, cols = heightmap.shape
+        vertex_count = rows * cols
+        device = torch.device("cuda")
+
+        hm = torch.from_numpy(np.ascontiguousarray(heightmap, dtype=np.float32)).to(device, non_blocking=True)
+        gy, gx = torch.meshgrid(
+            torch.arange(rows, device=device, dtype=torch.float32),
+            torch.arange(cols, device=device, dtype=torch.float32),
+            indexing="ij",
+        )
+        px = gx - 0.5 * cols
+        pz = gy - 0.5 * rows
+        top = torch.stack([px, hm * height_scale, pz], dim=-1).reshape(-1, 3)
+        bottom = torch.stack([px, torch.full_like(px, -base_thickness), pz], dim=-1).reshape(-1, 3)
+        torch.from_numpy(positions_out).copy_(torch.cat([top, bottom], dim=0))
+
+        active = torch.from_numpy(cell_active).to(device, non_blocking=True)
+        cell_y, cell_x = torch.nonzero(active, as_tuple=True)
+        tl = (cell_y * cols + cell_x).to(torch.int32)
+        tr = tl + 1
+        bl = tl + cols
+        br = bl + 1
+        btl, btr, bbl, bbr = (idx + vertex_count for idx in (tl, tr, bl, br))
+
+        padded = torch.zeros((rows + 1, cols + 1), dtype=torch.bool, device=device)
+        padded[1:-1, 1:-1] = active
+        py = cell_y + 1
+        px_cell = cell_x + 1
+        open_north = ~padded[py - 1, px_cell]
+        open_south = ~padded[py + 1, px_cell]
+        open_west = ~padded[py, px_cell - 1]
+        open_east = ~padded[py, px_cell + 1]
+
+        faces = torch.cat(
+            [
+                torch.stack([tl, bl, tr], dim=1),
+                torch.stack([tr, bl, br], dim=1),
+                torch.stack([btl, btr, bbl], dim=1),
+                torch.stack([btr, bbr, bbl], dim=1),
+                torch.stack([tl, btl, tr], dim=1)[open_north],
+                torch.stack([tr, btl, btr], dim=1)[open_north],
+                torch.stack([bl, br, bbl], dim=1)[open_south],
+                torch.stack([br, bbr, bbl], dim=1)[open_south],
+                torch.stack([tl, bl, btl], dim=1)[open_west],
+                torch.stack([bl, bbl, btl], dim=1)[open_west],
+                torch.stack([tr, btr, br], dim=1)[open_east],
+                torch.stack([br, btr, bbr], dim=1)[open_east],
+            ]
+        )
+        return faces.cpu().numpy()
+
     def _confidence_from_vertex_height(self, y_values: np.ndarray) -> np.ndarray:
         y = y_values.astype(np.float32)
         if y.size == 0:
@@ -436,23 +675,23 @@ class ReconstructionEngine:
         normalized = (y - y_min) / (y_max - y_min)
         return np.clip(normalized, 0.0, 1.0).astype(np.float32)
 
-    def _top_vertex_confidence(
-        self, heightmap: np.ndarray, y: int, x: int, surface_floor: float
-    ) -> float:
-        h = float(heightmap[y, x])
-        if h <= 0.0:
-            return 0.0
-
+    def _top_vertex_confidence(self, heightmap: np.ndarray, surface_floor: float) -> np.ndarray:
+        h = heightmap.astype(np.float64)
         base = np.clip((h - surface_floor) / max(1e-6, 1.0 - surface_floor), 0.0, 1.0)
 
-        y0 = max(0, y - 1)
-        y1 = min(heightmap.shape[0], y + 2)
-        x0 = max(0, x - 1)
-        x1 = min(heightmap.shape[1], x + 2)
-        patch = heightmap[y0:y1, x0:x1]
-        local_support = float(np.mean(patch > surface_floor))
+        # Fraction of supported cells in each vertex's 3x3 neighbourhood, clipped at the borders.
+        rows, cols = h.shape
+        support = np.pad((heightmap > surface_floor).astype(np.float64), 1)
+        support_sum = np.zeros((rows, cols), dtype=np.float64)
+        for dy in range(3):
+            for dx in range(3):
+                support_sum += support[dy : dy + rows, dx : dx + cols]
+        local_support = support_sum / _neighbourhood_sizes(rows, cols)
+
         edge_factor = 0.68 + 0.32 * local_support
-        return float(np.clip((0.34 + 0.66 * base) * edge_factor, 0.0, 1.0))
+        confidence = np.clip((0.34 + 0.66 * base) * edge_factor, 0.0, 1.0)
+        confidence[h <= 0.0] = 0.0
+        return confidence.astype(np.float32)
 
     def _confidence_to_colors(self, confidence: np.ndarray) -> np.ndarray:
         # Colorblind-safe palette: blue (observed), amber (adjusted), magenta (inferred).
@@ -511,8 +750,11 @@ class ReconstructionEngine:
 
     def _compute_vertex_normals(self, vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
         normals = np.zeros_like(vertices, dtype=np.float32)
-        tri = vertices[faces]
-        face_normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+        # Gather in half precision to halve bandwidth; edge/cross math stays in float32.
+        tri = vertices.astype(np.float16)[faces]
+        edge_a = (tri[:, 1] - tri[:, 0]).astype(np.float32)
+        edge_b = (tri[:, 2] - tri[:, 0]).astype(np.float32)
+        face_normals = np.cross(edge_a, edge_b)
         face_len = np.linalg.norm(face_normals, axis=1, keepdims=True)
         face_normals = np.divide(
             face_normals,
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import atexit
+import multiprocessing
+import os
 import random
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Iterable
 
 import numpy as np
 import torch
 
+from app.core.config import get_settings
+from app.reconstruction import _batch_worker
 from app.reconstruction.engine import ReconstructionResult, XRayInput
 from app.reconstruction.registry import model_registry
 
@@ -18,21 +25,57 @@ class PipelineStatus:
     message: str
 
 
-def set_deterministic_seed(seed: int) -> None:
+_seed_lock = threading.Lock()
+_seeded_with: int | None = None
+
+
+def set_deterministic_seed(seed: int, cudnn_benchmark: bool = False) -> None:
     random.seed(seed)
     np.random.seed(seed)
     torch.manual_seed(seed)
     if torch.cuda.is_available():
         torch.cuda.manual_seed_all(seed)
-    torch.backends.cudnn.deterministic = True
-    torch.backends.cudnn.benchmark = False
+    torch.backends.cudnn.deterministic = not cudnn_benchmark
+    torch.backends.cudnn.benchmark = cudnn_benchmark
+
+
+def _ensure_seeded(seed: int) -> None:
+    """Seed RNGs and set cuDNN flags once per process (again only if the seed changes)."""
+    global _seeded_with
+    with _seed_lock:
+        if _seeded_with == seed:
+            return
+        set_deterministic_seed(seed, cudnn_benchmark=get_settings().reconstruction_cudnn_benchmark)
+        _seeded_with = seed
+
+
+def _default_workers() -> int:
+    workers = os.cpu_count() or 1
+    if torch.cuda.is_available():
+        # Each worker opens its own CUDA context at import; keep to one worker per device.
+        workers = min(workers, max(1, torch.cuda.device_count()))
+    return workers
 
 
 class ReconstructionPipeline:
-    def __init__(self, model_name: str = "heightmap", seed: int = 42, batch_size: int = 4) -> None:
+    # Spawning workers and importing torch in each costs tens of seconds, so smaller
+    # batches run in-process unless the pool is already up.
+    _POOL_MIN_CASES = 16
+
+    def __init__(
+        self,
+        model_name: str = "heightmap",
+        seed: int = 42,
+        batch_size: int = 4,
+        max_workers: int | None = None,
+    ) -> None:
         self.model = model_registry.get(model_name)
+        self.model_name = model_name
         self.seed = seed
         self.batch_size = max(1, batch_size)
+        self.max_workers = max(1, max_workers or _default_workers())
+        self._pool: ProcessPoolExecutor | None = None
+        _ensure_seeded(seed)
 
     def run(self, inputs: Iterable[XRayInput]) -> tuple[ReconstructionResult, list[PipelineStatus]]:
         statuses: list[PipelineStatus] = []
@@ -41,7 +84,6 @@ class ReconstructionPipeline:
         statuses.append(PipelineStatus("inference", 65, f"Running inference with model '{self.model.name}'"))
         statuses.append(PipelineStatus("refinement", 85, "Refining mesh and confidence maps"))
 
-        set_deterministic_seed(self.seed)
         result = self.model.reconstruct(inputs)
         result.pipeline_version = self.model.pipeline_version
         statuses.append(PipelineStatus("complete", 100, "Reconstruction ready"))
@@ -50,13 +92,49 @@ class ReconstructionPipeline:
     def run_batch(self, batches: list[list[XRayInput]]) -> list[ReconstructionResult]:
         """
         Batch execution path for GPU-friendly workloads.
-        This executes in deterministic chunks and can be parallelized by worker processes.
+        Cases are independent, so they fan out over a pool of worker processes, each holding
+        its own pre-seeded pipeline; results come back in input order. Small batches run
+        in-process, since starting the pool costs more than it saves for them.
         """
-        set_deterministic_seed(self.seed)
+        if self.max_workers <= 1 or len(batches) <= 1:
+            return self._run_inline(batches)
+        if self._pool is None and len(batches) < self._POOL_MIN_CASES:
+            return self._run_inline(batches)
+
+        pool = self._get_pool()
+        return list(pool.map(_batch_worker.reconstruct_one, batches, chunksize=self.batch_size))
+
+    def _run_inline(self, batches: list[list[XRayInput]]) -> list[ReconstructionResult]:
         results: list[ReconstructionResult] = []
-        for i in range(0, len(batches), self.batch_size):
-            for case_inputs in batches[i : i + self.batch_size]:
-                result = self.model.reconstruct(case_inputs)
-                result.pipeline_version = self.model.pipeline_version
-                results.append(result)
+        for case_inputs in batches:
+            result = self.model.reconstruct(case_inputs)
+            result.pipeline_version = self.model.pipeline_version
+            results.append(result)
         return results
+
+    def close(self) -> None:
+        if self._pool is not None:
+            atexit.unregister(self.close)
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self) -> ReconstructionPipeline:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Spawn (not fork) so workers never inherit an initialized CUDA context.
+            context = multiprocessing.get_context("spawn")
+            gpu_count = torch.cuda.device_count() if torch.cuda.is_available() else 0
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=context,
+                initializer=_batch_worker.init_worker,
+                initargs=(self.model_name, self.seed, context.Value("i", 0), gpu_count),
+            )
+            # Pipelines are rarely closed explicitly; never leave worker processes behind.
+            atexit.register(self.close)
+        return self._pool
@@ -8,6 +8,7 @@ from typing import Any, Iterable, Protocol
 
 import numpy as np
 
+from app.reconstruction._glb_writer import write_glb
 from app.reconstruction.engine import ReconstructionEngine, ReconstructionResult, XRayInput
 from app.reconstruction.volumetric import VolumetricReconstructionModel
 
@@ -17,6 +18,9 @@ logger = logging.getLogger(__name__)
 _PROJECT_ROOT = Path(__file__).resolve().parents[2]
 _DEFAULT_CHECKPOINT = _PROJECT_ROOT.parent / "data" / "checkpoints" / "best.pt"
 
+# Shared by every heightmap-backed model so the mesh cache and warmed kernels are reused.
+_ENGINE = ReconstructionEngine()
+
 
 class ReconstructionModel(Protocol):
     name: str
@@ -32,7 +36,7 @@ class HeightmapModel:
     pipeline_version: str = "heightmap-v1"
 
     def __post_init__(self) -> None:
-        self._engine = ReconstructionEngine()
+        self._engine = _ENGINE
 
     def reconstruct(self, inputs: Iterable[XRayInput]) -> ReconstructionResult:
         result = self._engine.reconstruct(inputs)
@@ -56,7 +60,7 @@ class ImplicitFieldModel:
 
     def __post_init__(self) -> None:
         import os
-        self._fallback = ReconstructionEngine()
+        self._fallback = _ENGINE
         self._model = None
         self._device = None
 
@@ -176,57 +180,8 @@ class ImplicitFieldModel:
     @staticmethod
     def _build_glb(verts: np.ndarray, faces: np.ndarray, normals: np.ndarray) -> bytes:
         """Build a minimal GLB (glTF binary) from mesh data."""
-        import struct
-
-        verts = verts.astype(np.float32)
-        faces = faces.astype(np.uint32)
-        normals = normals.astype(np.float32)
-
-        vert_bytes = verts.tobytes()
-        face_bytes = faces.tobytes()
-        norm_bytes = normals.tobytes()
-
-        vert_min = verts.min(axis=0).tolist()
-        vert_max = verts.max(axis=0).tolist()
-
-        import json
-        gltf = {
-            "asset": {"version": "2.0", "generator": "OrthoGenesisAI-NeuralImplicit"},
-            "scene": 0,
-            "scenes": [{"nodes": [0]}],
-            "nodes": [{"mesh": 0}],
-            "meshes": [{"primitives": [{"attributes": {"POSITION": 0, "NORMAL": 2}, "indices": 1}]}],
-            "accessors": [
-                {"bufferView": 0, "componentType": 5126, "count": len(verts), "type": "VEC3",
-                 "min": vert_min, "max": vert_max},
-                {"bufferView": 1, "componentType": 5125, "count": faces.size, "type": "SCALAR",
-                 "min": [0], "max": [int(verts.shape[0] - 1)]},
-                {"bufferView": 2, "componentType": 5126, "count": len(normals), "type": "VEC3"},
-            ],
-            "bufferViews": [
-                {"buffer": 0, "byteOffset": 0, "byteLength": len(vert_bytes), "target": 34962},
-                {"buffer": 0, "byteOffset": len(vert_bytes), "byteLength": len(face_bytes), "target": 34963},
-                {"buffer": 0, "byteOffset": len(vert_bytes) + len(face_bytes), "byteLength": len(norm_bytes), "target": 34962},
-            ],
-            "buffers": [{"byteLength": len(vert_bytes) + len(face_bytes) + len(norm_bytes)}],
-        }
-
-        gltf_json = json.dumps(gltf, separators=(",", ":")).encode("utf-8")
-        # Pad JSON to 4-byte alignment
-        while len(gltf_json) % 4 != 0:
-            gltf_json += b" "
-
-        bin_data = vert_bytes + face_bytes + norm_bytes
-        while len(bin_data) % 4 != 0:
-            bin_data += b"\x00"
-
-        total = 12 + 8 + len(gltf_json) + 8 + len(bin_data)
         out = io.BytesIO()
-        out.write(struct.pack("<4sII", b"glTF", 2, total))
-        out.write(struct.pack("<I4s", len(gltf_json), b"JSON"))
-        out.write(gltf_json)
-        out.write(struct.pack("<I4s", len(bin_data), b"BIN\x00"))
-        out.write(bin_data)
+        write_glb(out, verts, faces, vertex_normals=normals, generator="OrthoGenesisAI-NeuralImplicit")
         return out.getvalue()
 
 
@@ -0,0 +1,59 @@
+"""Numba kernels for the integer DICOM preview path.
+
+Both kernels are ``None`` when numba is not installed; callers fall back to
+``np.bincount`` and a NumPy table gather in ``app.services.dicom``.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+
+try:
+    from numba import get_num_threads, njit, prange
+except Exception:  # pragma: no cover - optional runtime dependency
+    njit = None
+
+
+def _key_histogram(keys: np.ndarray, bins: int, chunks: int) -> np.ndarray:
+    """``np.bincount(keys, minlength=bins)`` with one private histogram per chunk, then reduced."""
+    size = keys.size
+    step = (size + chunks - 1) // chunks
+    partial = np.zeros((chunks, bins), dtype=np.int64)
+    for chunk in prange(chunks):
+        row = partial[chunk]
+        for i in range(chunk * step, min(size, (chunk + 1) * step)):
+            row[keys[i]] += 1
+    counts = partial[0].copy()
+    for chunk in range(1, chunks):
+        counts += partial[chunk]
+    return counts
+
+
+def _apply_table(keys: np.ndarray, table: np.ndarray, out: np.ndarray) -> None:
+    for i in prange(keys.size):
+        out[i] = table[keys[i]]
+
+
+# Ingestion runs in worker threads (``ingest_dicom_async``), and numba's fallback
+# ``workqueue`` threading layer aborts the process on concurrent parallel launches.
+# The kernels take milliseconds, so callers simply take turns.
+_launch_lock = threading.Lock()
+
+if njit is not None:
+    _key_histogram_jit = njit(cache=True, parallel=True, boundscheck=False)(_key_histogram)
+    _apply_table_jit = njit(cache=True, parallel=True, boundscheck=False)(_apply_table)
+
+    def key_histogram(keys: np.ndarray, bins: int) -> np.ndarray:
+        # Small images stay in one chunk; splitting only pays off past a few 64k-pixel blocks.
+        chunks = max(1, min(get_num_threads(), keys.size // 65536))
+        with _launch_lock:
+            return _key_histogram_jit(keys, bins, chunks)
+
+    def apply_table(keys: np.ndarray, table: np.ndarray, out: np.ndarray) -> None:
+        with _launch_lock:
+            _apply_table_jit(keys, table, out)
+else:
+    key_histogram = None
+    apply_table = None
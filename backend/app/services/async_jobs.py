@@ -3,22 +3,34 @@ from __future__ import annotations
 import hashlib
 import hmac
 import json
+import select
 import threading
-import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any
 
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+try:
+    import blake3
+except Exception:  # pragma: no cover - optional runtime dependency
+    blake3 = None
+
 from app.core.config import get_settings
 from app.db import models
 from app.db.session import SessionLocal
 from app.reconstruction.confidence import ConfidenceCalibrator
-from app.reconstruction.engine import XRayInput
+from app.reconstruction.engine import XRayInput, decode_xray_pinned
 from app.reconstruction.pipeline import ReconstructionPipeline
 from app.services.mesh import convert_mesh
-from app.storage.local import read_file, save_export, save_uncertainty_map
+from app.storage.local import read_file, save_export_with_digest, save_uncertainty_map
+
+
+# Postgres channel notified on enqueue so idle workers wake without polling.
+_QUEUE_CHANNEL = "async_job_queue"
+_IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="async-job-io")
 
 
 def _utcnow() -> datetime:
@@ -27,12 +39,20 @@ def _utcnow() -> datetime:
 
 def _hash_payload(payload: dict[str, Any]) -> str:
     canonical = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    if blake3 is not None:
+        return blake3.blake3(canonical).hexdigest()
     return hashlib.sha256(canonical).hexdigest()
 
 
+def _load_xray_input(view: str, file_key: str) -> XRayInput:
+    data = read_file(file_key)
+    return XRayInput(view=view, content_type="image/png", data=data, pixels=decode_xray_pinned(data))
+
+
 def enqueue_job(
     db: Session, *, job_type: str, payload: dict[str, Any], max_attempts: int = 3
 ) -> models.AsyncJob:
+    now = _utcnow()
     job = models.AsyncJob(
         id=uuid.uuid4().hex,
         job_type=job_type,
@@ -45,12 +65,19 @@ def enqueue_job(
         progress=0,
         eta_seconds=None,
         dead_letter=False,
-        available_at=_utcnow(),
-        updated_at=_utcnow(),
+        available_at=now,
+        created_at=now,
+        updated_at=now,
     )
     db.add(job)
+    # Every column is set client-side, so detach the flushed row instead of letting the
+    # commit expire it and paying a SELECT on the next attribute access.
+    db.flush()
+    db.expunge(job)
+    if db.get_bind().dialect.name == "postgresql":
+        # NOTIFY is transactional: listeners are woken when this commit lands.
+        db.execute(text(f"NOTIFY {_QUEUE_CHANNEL}"))
     db.commit()
-    db.refresh(job)
     return job
 
 
@@ -77,10 +104,55 @@ class AsyncJobWorker:
             self._thread.join(timeout=2.0)
 
     def _run_loop(self) -> None:
-        while not self._stop_event.is_set():
-            processed = self._try_process_one()
-            if not processed:
-                time.sleep(self._poll_interval_sec)
+        listener = None
+        try:
+            while not self._stop_event.is_set():
+                processed = self._try_process_one()
+                if processed:
+                    continue
+                if listener is None:
+                    listener = self._open_listener()
+                if not self._wait_for_notify(listener):
+                    listener = None
+        finally:
+            if listener is not None:
+                listener.close()
+
+    def _open_listener(self):
+        """Dedicated autocommit connection LISTENing on the queue channel; ``None`` off Postgres."""
+        engine = SessionLocal.kw["bind"]
+        if engine.dialect.name != "postgresql":
+            return None
+        try:
+            raw = engine.raw_connection()
+            raw.detach()
+            conn = raw.driver_connection
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {_QUEUE_CHANNEL}")
+            return conn
+        except Exception:
+            return None
+
+    def _wait_for_notify(self, listener) -> bool:
+        """Block until a job is enqueued or the poll interval elapses; False if the listener broke."""
+        if listener is None:
+            self._stop_event.wait(self._poll_interval_sec)
+            return True
+        # The timeout still matters: retries become due via available_at without any NOTIFY.
+        try:
+            readable, _, _ = select.select([listener], [], [], self._poll_interval_sec)
+            if readable:
+                listener.poll()
+                listener.notifies.clear()
+            return True
+        except Exception:
+            try:
+                listener.close()
+            except Exception:
+                pass
+            self._stop_event.wait(self._poll_interval_sec)
+            return False
 
     def _try_process_one(self) -> bool:
         with SessionLocal() as db:
@@ -93,6 +165,7 @@ class AsyncJobWorker:
                     models.AsyncJob.available_at <= now,
                 )
                 .order_by(models.AsyncJob.created_at.asc())
+                .with_for_update(skip_locked=True)
                 .first()
             )
             if not job:
@@ -245,10 +318,10 @@ class AsyncJobWorker:
             seed=seed,
             batch_size=settings.reconstruction_batch_size,
         )
-        inputs = [
-            XRayInput(view=xray.view, content_type="image/png", data=read_file(xray.file_key))
-            for xray in xrays
-        ]
+        # Resolve ORM attributes here; the session must not be touched from pool threads.
+        views = [xray.view for xray in xrays]
+        file_keys = [xray.file_key for xray in xrays]
+        inputs = list(_IO_POOL.map(_load_xray_input, views, file_keys))
         if job:
             self._update_job_progress(
                 db,
@@ -363,8 +436,7 @@ class AsyncJobWorker:
             .count()
             + 1
         )
-        key = save_export(converted, f"{model_id}_v{export_version}", output_format)
-        checksum = hashlib.sha256(converted).hexdigest()
+        key, checksum = save_export_with_digest(converted, f"{model_id}_v{export_version}", output_format)
         secret = get_settings().secret_key.encode("utf-8")
         signature = hmac.new(secret, checksum.encode("utf-8"), digestmod=hashlib.sha256).hexdigest()
         expires_at = _utcnow() + timedelta(hours=72)
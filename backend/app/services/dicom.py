@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from io import BytesIO
 from typing import Any
@@ -7,10 +8,23 @@ from typing import Any
 import numpy as np
 from PIL import Image
 
+from app.core.config import get_settings
+from app.services._dicom_kernels import apply_table, key_histogram
+
 try:
     import pydicom
 except Exception:  # pragma: no cover - optional dependency in some local setups
     pydicom = None
+apply_modality_lut = None
+if pydicom is not None:
+    try:
+        from pydicom.pixels import apply_modality_lut
+    except ImportError:  # pragma: no cover - pydicom < 3.0
+        from pydicom.pixel_data_handlers.util import apply_modality_lut
+try:
+    import cv2
+except Exception:  # pragma: no cover - optional runtime dependency
+    cv2 = None
 
 
 @dataclass
@@ -27,6 +41,7 @@ class DicomIngestionResult:
     spacing_y: float | None
     modality: str | None
     accession_number: str | None
+    render_extension: str = "png"
 
 
 def is_dicom_upload(filename: str | None, content_type: str | None, content: bytes) -> bool:
@@ -44,15 +59,72 @@ def _safe_str(value: Any) -> str | None:
     return text or None
 
 
-def _normalize_to_uint8(array: np.ndarray) -> np.ndarray:
-    arr = array.astype(np.float32)
-    low = float(np.percentile(arr, 1.0))
-    high = float(np.percentile(arr, 99.0))
+def _integer_keys(pixels: np.ndarray) -> tuple[np.ndarray, int] | None:
+    """Flat unsigned view of <=16-bit integer pixels plus the offset back to stored values."""
+    if pixels.dtype.kind not in "ui" or pixels.dtype.itemsize > 2 or pixels.size == 0:
+        return None
+    keys = pixels.reshape(-1)
+    if pixels.dtype.kind == "u":
+        return keys, 0
+    # Flipping the sign bit maps signed values onto an order-preserving unsigned range.
+    bits = pixels.dtype.itemsize * 8
+    return keys.view(np.dtype(f"u{pixels.dtype.itemsize}")) ^ (1 << (bits - 1)), -(1 << (bits - 1))
+
+
+def _percentiles(
+    pixels: np.ndarray, q: list[float], keys: tuple[np.ndarray, int] | None = None
+) -> np.ndarray:
+    """``np.percentile(pixels, q)`` (linear method); one histogram pass for <=16-bit integers."""
+    if keys is None:
+        return np.percentile(pixels, q)
+
+    key_array, offset = keys
+    bins = 1 << (key_array.dtype.itemsize * 8)
+    if key_histogram is not None:
+        histogram = key_histogram(key_array, bins)
+    else:
+        histogram = np.bincount(key_array, minlength=bins)
+    cumulative = np.cumsum(histogram)
+    count = int(cumulative[-1])
+
+    ranks = np.asarray(q, dtype=np.float64) / 100.0 * (count - 1)
+    below = np.floor(ranks)
+    above = np.minimum(below + 1, count - 1)
+    a = np.searchsorted(cumulative, below, side="right").astype(np.float64) + offset
+    b = np.searchsorted(cumulative, above, side="right").astype(np.float64) + offset
+    # Same interpolation form as numpy's linear method.
+    t = ranks - below
+    return np.where(t >= 0.5, b - (b - a) * (1.0 - t), a + (b - a) * t)
+
+
+def _normalize_to_uint8(array: np.ndarray, low: float, high: float) -> np.ndarray:
+    arr = array.astype(np.float32, copy=False)
     denom = max(1e-6, high - low)
     out = np.clip((arr - low) / denom, 0.0, 1.0)
     return np.round(out * 255.0).astype(np.uint8)
 
 
+def _encode_preview(image_uint8: np.ndarray) -> tuple[bytes, str]:
+    """Encode the preview per settings; PNG (lossless, fast zlib level) unless JPEG is configured."""
+    settings = get_settings()
+    as_jpeg = settings.dicom_preview_format.lower() in {"jpg", "jpeg"}
+    if cv2 is not None:
+        if as_jpeg:
+            params = [cv2.IMWRITE_JPEG_QUALITY, settings.dicom_preview_jpeg_quality]
+        else:
+            params = [cv2.IMWRITE_PNG_COMPRESSION, settings.dicom_preview_png_compression]
+        ok, buffer = cv2.imencode(".jpg" if as_jpeg else ".png", image_uint8, params)
+        if ok:
+            return buffer.tobytes(), "jpg" if as_jpeg else "png"
+    image = Image.fromarray(image_uint8, mode="L")
+    output = BytesIO()
+    if as_jpeg:
+        image.save(output, format="JPEG", quality=settings.dicom_preview_jpeg_quality)
+        return output.getvalue(), "jpg"
+    image.save(output, format="PNG", compress_level=settings.dicom_preview_png_compression, optimize=False)
+    return output.getvalue(), "png"
+
+
 def _deidentify_dataset(dataset: "pydicom.dataset.FileDataset") -> None:
     fields = [
         "PatientName",
@@ -82,18 +154,54 @@ def ingest_dicom(content: bytes) -> DicomIngestionResult:
 
     _deidentify_dataset(ds)
 
-    pixel_array = ds.pixel_array.astype(np.float32)
-    slope = float(getattr(ds, "RescaleSlope", 1.0) or 1.0)
-    intercept = float(getattr(ds, "RescaleIntercept", 0.0) or 0.0)
-    pixel_array = pixel_array * slope + intercept
-
-    if _safe_str(getattr(ds, "PhotometricInterpretation", None)) == "MONOCHROME1":
-        pixel_array = pixel_array.max() - pixel_array
-
-    image_uint8 = _normalize_to_uint8(pixel_array)
-    image = Image.fromarray(image_uint8, mode="L")
-    output = BytesIO()
-    image.save(output, format="PNG")
+    raw = ds.pixel_array
+    if ds.get("ModalityLUTSequence"):
+        # A Modality LUT replaces the linear rescale and yields uint8/uint16 output values.
+        raw = apply_modality_lut(raw, ds)
+        slope, intercept = 1.0, 0.0
+    else:
+        slope = float(getattr(ds, "RescaleSlope", 1.0) or 1.0)
+        intercept = float(getattr(ds, "RescaleIntercept", 0.0) or 0.0)
+    monochrome1 = _safe_str(getattr(ds, "PhotometricInterpretation", None)) == "MONOCHROME1"
+    # CR/DX data is usually stored unscaled; skip the float rescale pass entirely then.
+    rescaled = slope != 1.0 or intercept != 0.0
+
+    # Percentiles are taken on the stored values; the rescale only moves the thresholds.
+    keys = _integer_keys(raw)
+    raw_min, raw_low, raw_high, raw_max = _percentiles(raw, [0.0, 1.0, 99.0, 100.0], keys)
+    low, high = float(raw_low) * slope + intercept, float(raw_high) * slope + intercept
+    if slope < 0:
+        low, high = high, low
+    if monochrome1:
+        peak = (np.array([raw_min, raw_max], dtype=np.float32) * slope + intercept).max()
+        low, high = float(peak) - high, float(peak) - low
+
+    if keys is not None:
+        # Every stored value maps through one uint8 table; MONOCHROME1 is folded into it.
+        key_array, offset = keys
+        levels = np.arange(offset, offset + (1 << (key_array.dtype.itemsize * 8))).astype(np.float32)
+        if rescaled:
+            levels = levels * slope + intercept
+        if monochrome1:
+            levels = peak - levels
+        table = _normalize_to_uint8(levels, low, high)
+        if apply_table is not None:
+            image_uint8 = np.empty(raw.shape, dtype=np.uint8)
+            apply_table(key_array, table, image_uint8.reshape(-1))
+        else:
+            image_uint8 = table[key_array].reshape(raw.shape)
+    else:
+        pixel_array = raw.astype(np.float32, copy=rescaled or monochrome1)
+        if rescaled:
+            if monochrome1:
+                # peak - (x * slope + intercept), folded into the same multiply-add.
+                slope, intercept = -slope, float(peak) - intercept
+            np.multiply(pixel_array, slope, out=pixel_array)
+            np.add(pixel_array, intercept, out=pixel_array)
+        elif monochrome1:
+            np.subtract(peak, pixel_array, out=pixel_array)
+        image_uint8 = _normalize_to_uint8(pixel_array, low, high)
+    render_bytes, render_extension = _encode_preview(image_uint8)
 
     dicom_bytes = BytesIO()
     ds.save_as(dicom_bytes, write_like_original=False)
@@ -122,7 +230,7 @@ def ingest_dicom(content: bytes) -> DicomIngestionResult:
 
     return DicomIngestionResult(
         deidentified_bytes=dicom_bytes.getvalue(),
-        render_bytes=output.getvalue(),
+        render_bytes=render_bytes,
         metadata=metadata,
         study_instance_uid=metadata["study_instance_uid"],
         series_instance_uid=metadata["series_instance_uid"],
@@ -133,4 +241,10 @@ def ingest_dicom(content: bytes) -> DicomIngestionResult:
         spacing_y=spacing_y,
         modality=metadata["modality"],
         accession_number=metadata["accession_number"],
+        render_extension=render_extension,
     )
+
+
+async def ingest_dicom_async(content: bytes) -> DicomIngestionResult:
+    """``ingest_dicom`` off the event loop, for async request handlers."""
+    return await asyncio.to_thread(ingest_dicom, content)
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from io import BytesIO
 
 import numpy as np
 import trimesh
 
+try:
+    import fast_simplification
+except Exception:  # pragma: no cover - optional runtime dependency
+    fast_simplification = None
+try:
+    from scipy import sparse
+    from scipy.sparse import csgraph
+except Exception:  # pragma: no cover - optional runtime dependency
+    sparse = None
+    csgraph = None
+
 
 @dataclass(frozen=True)
 class MeshQualityProfile:
@@ -26,45 +40,108 @@ QUALITY_PROFILES: dict[str, MeshQualityProfile] = {
     "web": MeshQualityProfile("web", target_ratio=0.62, taubin_iterations=3, scale_mode="conservative"),
 }
 
+# Users often export the same upload in several formats/profiles, so keep the repaired source
+# geometry plus recent exports around, keyed on a digest of the input bytes. Both caches are
+# bounded by total bytes; the source cache holds bare vertex/face arrays, not Trimesh objects
+# with their derived-data caches.
+_LOAD_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_LOAD_CACHE_ENTRY_MAX_BYTES = 64 * 1024 * 1024
+_EXPORT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_EXPORT_CACHE_ENTRY_MAX_BYTES = 16 * 1024 * 1024
+
+
+class _ByteBoundedLRU:
+    def __init__(self, max_bytes: int, entry_max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.entry_max_bytes = entry_max_bytes
+        self._entries: OrderedDict[tuple, tuple[object, int]] = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: tuple, value: object, nbytes: int) -> None:
+        if nbytes > self.entry_max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total -= previous[1]
+            self._entries[key] = (value, nbytes)
+            self._total += nbytes
+            while self._total > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._total -= evicted
 
-def _as_mesh(loaded: trimesh.Trimesh | trimesh.Scene) -> trimesh.Trimesh:
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total = 0
+
+
+_load_cache = _ByteBoundedLRU(_LOAD_CACHE_MAX_BYTES, _LOAD_CACHE_ENTRY_MAX_BYTES)
+_export_cache = _ByteBoundedLRU(_EXPORT_CACHE_MAX_BYTES, _EXPORT_CACHE_ENTRY_MAX_BYTES)
+
+
+def _largest_part(loaded: trimesh.Trimesh | trimesh.Scene) -> trimesh.Trimesh:
+    """Largest connected component by area across the payload's geometries."""
     if isinstance(loaded, trimesh.Trimesh):
-        return loaded
+        return _largest_component(loaded)
     if isinstance(loaded, trimesh.Scene):
         geometries = [g for g in loaded.geometry.values() if isinstance(g, trimesh.Trimesh)]
         if not geometries:
             raise ValueError("No mesh geometry found in input data")
-        return trimesh.util.concatenate(geometries)
+        # Components never span geometries, so there is no need to concatenate and re-split.
+        return max((_largest_component(g) for g in geometries), key=lambda part: float(part.area))
     raise ValueError("Unsupported mesh payload")
 
 
 def _repair_mesh(mesh: trimesh.Trimesh) -> trimesh.Trimesh:
-    repaired = mesh.copy()
-    repaired.remove_unreferenced_vertices()
+    """Repairs ``mesh`` in place; callers pass a freshly loaded mesh they do not reuse."""
+    mesh.remove_unreferenced_vertices()
     try:
-        repaired.remove_degenerate_faces()
+        mesh.remove_degenerate_faces()
     except Exception:
         pass
     try:
-        repaired.remove_duplicate_faces()
+        mesh.remove_duplicate_faces()
     except Exception:
         pass
     try:
-        repaired.merge_vertices()
+        mesh.merge_vertices()
     except Exception:
         pass
     try:
-        repaired.fill_holes()
+        mesh.fill_holes()
     except Exception:
         pass
-    return repaired
+    return mesh
 
 
 def _largest_component(mesh: trimesh.Trimesh) -> trimesh.Trimesh:
-    components = mesh.split(only_watertight=False)
-    if len(components) <= 1:
+    if csgraph is None:
+        components = mesh.split(only_watertight=False)
+        if len(components) <= 1:
+            return mesh
+        return max(components, key=lambda part: float(part.area))
+    # Label faces and only build the winning component, rather than one Trimesh per part.
+    face_count = len(mesh.faces)
+    adjacency = mesh.face_adjacency
+    graph = sparse.coo_matrix(
+        (np.ones(len(adjacency), dtype=bool), (adjacency[:, 0], adjacency[:, 1])),
+        shape=(face_count, face_count),
+    )
+    count, labels = csgraph.connected_components(graph, directed=False)
+    if count <= 1:
         return mesh
-    return max(components, key=lambda part: float(part.area))
+    areas = np.bincount(labels, weights=mesh.area_faces, minlength=count)
+    return mesh.submesh([np.flatnonzero(labels == int(np.argmax(areas)))], append=True)
 
 
 def _decimate(mesh: trimesh.Trimesh, ratio: float) -> trimesh.Trimesh:
@@ -74,7 +151,11 @@ def _decimate(mesh: trimesh.Trimesh, ratio: float) -> trimesh.Trimesh:
     if target_faces >= len(mesh.faces):
         return mesh
     try:
-        decimated = mesh.simplify_quadratic_decimation(target_faces)
+        if fast_simplification is not None:
+            vertices, faces = fast_simplification.simplify(mesh.vertices, mesh.faces, target_count=target_faces)
+            decimated = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+        else:
+            decimated = mesh.simplify_quadric_decimation(face_count=target_faces)
         if isinstance(decimated, trimesh.Trimesh) and len(decimated.faces) > 0:
             return decimated
     except Exception:
@@ -88,9 +169,31 @@ def _smooth_taubin(
     if iterations <= 0:
         return
     try:
-        trimesh.smoothing.filter_taubin(
-            mesh, lamb=smoothing_lambda, nu=smoothing_nu, iterations=iterations
+        if sparse is None:
+            trimesh.smoothing.filter_taubin(
+                mesh, lamb=smoothing_lambda, nu=smoothing_nu, iterations=iterations
+            )
+            return
+        # Same umbrella operator and alternating passes as trimesh's filter_taubin, but the
+        # row-normalised adjacency is built once in CSR form instead of as a COO matrix.
+        edges = mesh.edges
+        count = len(mesh.vertices)
+        adjacency = sparse.csr_matrix(
+            (np.ones(len(edges)), (edges[:, 0], edges[:, 1])), shape=(count, count)
         )
+        degree = np.asarray(adjacency.sum(axis=1)).ravel()
+        degree[degree == 0] = 1.0
+        laplacian = sparse.diags(1.0 / degree) @ adjacency
+
+        vertices = mesh.vertices.copy().view(np.ndarray)
+        for index in range(iterations):
+            delta = laplacian @ vertices
+            delta -= vertices
+            if index % 2 == 0:
+                vertices += smoothing_lambda * delta
+            else:
+                vertices -= smoothing_nu * delta
+        mesh.vertices = vertices
     except Exception:
         return
 
@@ -150,25 +253,41 @@ def convert_mesh(
     if input_format == "gltf":
         input_format = "glb"
 
-    loaded = trimesh.load(BytesIO(data), file_type=input_format)
-    mesh = _as_mesh(loaded)
-    mesh = _largest_component(mesh)
-    mesh = _repair_mesh(mesh)
-    mesh = _decimate(mesh, profile.target_ratio)
+    if output_format == "gltf":
+        output_format = "glb"
     iterations = profile.taubin_iterations
     if tolerance_mm is not None:
         if tolerance_mm < 0.2:
             iterations = max(2, iterations - 1)
         elif tolerance_mm > 0.8:
             iterations = iterations + 1
+
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    export_key = (digest, input_format, output_format, profile.name, units.lower(), iterations)
+    cached_export = _export_cache.get(export_key)
+    if cached_export is not None:
+        return cached_export
+
+    cached_source = _load_cache.get((digest, input_format))
+    if cached_source is None:
+        loaded = trimesh.load(BytesIO(data), file_type=input_format)
+        source = _repair_mesh(_largest_part(loaded))
+        vertices = np.asarray(source.vertices).view(np.ndarray)
+        faces = np.asarray(source.faces).view(np.ndarray)
+        _load_cache.put((digest, input_format), (vertices, faces), vertices.nbytes + faces.nbytes)
+    else:
+        vertices, faces = cached_source
+        source = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+
+    # The cached arrays must stay untouched; decimation normally hands back a new mesh.
+    mesh = _decimate(source, profile.target_ratio)
+    if mesh is source:
+        mesh = trimesh.Trimesh(vertices=vertices.copy(), faces=faces.copy(), process=False)
     _smooth_taubin(mesh, iterations, profile.smoothing_lambda, profile.smoothing_nu)
     _scale_units(mesh, profile.scale_mode, units=units)
-    mesh = _repair_mesh(mesh)
-
-    if output_format == "gltf":
-        output_format = "glb"
 
     exported = mesh.export(file_type=output_format)
     if isinstance(exported, str):
-        return exported.encode("utf-8")
+        exported = exported.encode("utf-8")
+    _export_cache.put(export_key, exported, len(exported))
     return exported
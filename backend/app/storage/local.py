@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+from contextlib import contextmanager
+import hashlib
 import json
 from pathlib import Path
+from typing import BinaryIO, Iterator
 import uuid
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional runtime dependency
+    orjson = None
+
 BASE_DIR = Path(__file__).resolve().parents[3]
 DATA_DIR = BASE_DIR / "data"
 UPLOAD_DIR = DATA_DIR / "uploads"
@@ -11,11 +20,35 @@ MODEL_DIR = DATA_DIR / "models"
 EXPORT_DIR = DATA_DIR / "exports"
 CONFIDENCE_DIR = DATA_DIR / "confidence"
 UNCERTAINTY_DIR = DATA_DIR / "uncertainty"
+_DIGEST_CHUNK = 1 << 16
+# Savers still mkdir their own parent, so a directory removed at runtime is recreated.
+_dirs_ready = False
+
+
+def _dump_json(payload: dict) -> bytes:
+    if orjson is not None:
+        # Reports can carry numpy scalars/arrays straight from the reconstruction code.
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _load_json(raw: bytes) -> dict:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Files written by the stdlib encoder may contain NaN/Infinity, which orjson rejects.
+            pass
+    return json.loads(raw)
 
 
 def ensure_dirs() -> None:
+    global _dirs_ready
+    if _dirs_ready:
+        return
     for directory in (UPLOAD_DIR, MODEL_DIR, EXPORT_DIR, CONFIDENCE_DIR, UNCERTAINTY_DIR):
         directory.mkdir(parents=True, exist_ok=True)
+    _dirs_ready = True
 
 
 def save_upload(content: bytes, filename: str) -> str:
@@ -28,6 +61,11 @@ def save_upload(content: bytes, filename: str) -> str:
     return key
 
 
+async def save_upload_async(content: bytes, filename: str) -> str:
+    """``save_upload`` off the event loop, for async request handlers."""
+    return await asyncio.to_thread(save_upload, content, filename)
+
+
 def save_model(data: bytes, model_id: str | None = None, ext: str = "glb") -> str:
     ensure_dirs()
     model_id = model_id or uuid.uuid4().hex
@@ -38,6 +76,22 @@ def save_model(data: bytes, model_id: str | None = None, ext: str = "glb") -> st
     return key
 
 
+@contextmanager
+def open_model_writer(model_id: str | None = None, ext: str = "glb") -> Iterator[tuple[str, BinaryIO]]:
+    """Yield ``(key, file_obj)`` so exporters can write model bytes straight to storage."""
+    ensure_dirs()
+    model_id = model_id or uuid.uuid4().hex
+    key = f"models/{model_id}.{ext}"
+    path = DATA_DIR / key
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with path.open("wb") as handle:
+            yield key, handle
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+
+
 def save_export(data: bytes, model_id: str, ext: str) -> str:
     ensure_dirs()
     key = f"exports/{model_id}.{ext}"
@@ -47,13 +101,29 @@ def save_export(data: bytes, model_id: str, ext: str) -> str:
     return key
 
 
+def save_export_with_digest(data: bytes, model_id: str, ext: str) -> tuple[str, str]:
+    """Like ``save_export`` but hashes each chunk while it is written; returns ``(key, sha256 hex)``."""
+    ensure_dirs()
+    key = f"exports/{model_id}.{ext}"
+    path = DATA_DIR / key
+    path.parent.mkdir(parents=True, exist_ok=True)
+    hasher = hashlib.sha256()
+    view = memoryview(data)
+    with path.open("wb") as handle:
+        for start in range(0, len(view), _DIGEST_CHUNK):
+            chunk = view[start : start + _DIGEST_CHUNK]
+            handle.write(chunk)
+            hasher.update(chunk)
+    return key, hasher.hexdigest()
+
+
 def save_confidence_report(model_key: str, report: dict) -> str:
     ensure_dirs()
     model_id = Path(model_key).stem
     key = f"confidence/{model_id}.json"
     path = DATA_DIR / key
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(report), encoding="utf-8")
+    path.write_bytes(_dump_json(report))
     return key
 
 
@@ -63,7 +133,7 @@ def read_confidence_report(model_key: str) -> dict | None:
     if not path.exists():
         return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return _load_json(path.read_bytes())
     except Exception:
         return None
 
@@ -74,7 +144,7 @@ def save_uncertainty_map(model_key: str, uncertainty: dict) -> str:
     key = f"uncertainty/{model_id}.json"
     path = DATA_DIR / key
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(uncertainty), encoding="utf-8")
+    path.write_bytes(_dump_json(uncertainty))
     return key
 
 
@@ -85,7 +155,7 @@ def read_uncertainty_map(key: str | None) -> dict | None:
     if not path.exists():
         return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return _load_json(path.read_bytes())
     except Exception:
         return None
 
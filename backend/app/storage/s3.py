@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import threading
 import uuid
+from functools import lru_cache
+from io import BytesIO
 from typing import BinaryIO
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 
 from app.core.config import get_settings
 
+_bucket_ready: set[str] = set()
+_bucket_lock = threading.Lock()
+# Objects above 8 MiB move as concurrent multipart parts / ranged GETs instead of one serial request.
+_TRANSFER_CONFIG = TransferConfig(multipart_threshold=8 * 1024 * 1024, max_concurrency=10, use_threads=True)
 
+
+@lru_cache
 def get_s3_client():
     settings = get_settings()
     session = boto3.session.Session()
@@ -22,11 +32,17 @@ def get_s3_client():
 
 def ensure_bucket() -> None:
     settings = get_settings()
-    s3 = get_s3_client()
-    try:
-        s3.head_bucket(Bucket=settings.s3_bucket)
-    except Exception:
-        s3.create_bucket(Bucket=settings.s3_bucket)
+    if settings.s3_bucket in _bucket_ready:
+        return
+    with _bucket_lock:
+        if settings.s3_bucket in _bucket_ready:
+            return
+        s3 = get_s3_client()
+        try:
+            s3.head_bucket(Bucket=settings.s3_bucket)
+        except Exception:
+            s3.create_bucket(Bucket=settings.s3_bucket)
+        _bucket_ready.add(settings.s3_bucket)
 
 
 def upload_file(file_obj: BinaryIO, content_type: str, prefix: str) -> str:
@@ -39,6 +55,7 @@ def upload_file(file_obj: BinaryIO, content_type: str, prefix: str) -> str:
         settings.s3_bucket,
         key,
         ExtraArgs={"ContentType": content_type},
+        Config=_TRANSFER_CONFIG,
     )
     return key
 
@@ -50,7 +67,13 @@ def upload_bytes(data: bytes, content_type: str, key: str | None = None, prefix:
     if not key:
         prefix_value = prefix or "uploads"
         key = f"{prefix_value}/{uuid.uuid4().hex}"
-    s3.put_object(Bucket=settings.s3_bucket, Key=key, Body=data, ContentType=content_type)
+    s3.upload_fileobj(
+        BytesIO(data),
+        settings.s3_bucket,
+        key,
+        ExtraArgs={"ContentType": content_type},
+        Config=_TRANSFER_CONFIG,
+    )
     return key
 
 
@@ -68,5 +91,6 @@ def presign_download(key: str, expires_in: int = 3600) -> str:
 def download_file(key: str) -> bytes:
     settings = get_settings()
     s3 = get_s3_client()
-    response = s3.get_object(Bucket=settings.s3_bucket, Key=key)
-    return response["Body"].read()
+    buffer = BytesIO()
+    s3.download_fileobj(settings.s3_bucket, key, buffer, Config=_TRANSFER_CONFIG)
+    return buffer.getvalue()